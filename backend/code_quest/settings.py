@@ -1,23 +1,24 @@
 from pathlib import Path
 import os
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 # Base directory
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 load_dotenv(BASE_DIR / ".env")
 
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = os.environ.get('DEBUG', 'False') == 'True' 
+
 # SECURITY WARNING: keep the secret key used in production secret!
+# A fixed key is required so sessions survive worker restarts; only debug
+# runs fall back to a well-known development key.
 SECRET_KEY = os.environ.get('SECRET_KEY')
 if not SECRET_KEY:
-    import random
-    import string
-    chars = 'abcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*(-_=+)'
-    SECRET_KEY = ''.join(random.SystemRandom().choice(chars) for _ in range(50))
-    print("WARNING: SECRET_KEY not found in environment. Generated temporary key.")
-
-# SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.environ.get('DEBUG', 'False') == 'True' 
+    if not DEBUG:
+        raise ImproperlyConfigured("SECRET_KEY not set")
+    SECRET_KEY = 'dev-insecure-key'
 
 ALLOWED_HOSTS = []
 
@@ -84,6 +85,19 @@ DATABASES = {
     }
 }
 
+# Cache (job lookups during applications)
+# Local memory by default; set REDIS_URL to share the cache across processes
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -46,6 +46,8 @@ class ResumeSubmissionAdmin(admin.ModelAdmin):
     Features:
     - List view showing submission ID, candidate info, job, match score, and fit
     - Filter by job posting and overall fit category
+    - Job loaded via JOIN in the list view (no per-row query); large text
+      and JSON columns are not loaded for the list
     - Detailed view showing all evaluation results
     - Read-only fields for extracted text and evaluation results
     - Hierarchical field organization: candidate info → evaluation → analysis
@@ -58,8 +60,10 @@ class ResumeSubmissionAdmin(admin.ModelAdmin):
     - Read detailed feedback and structured assessments
     - Filter submissions by job or fit level for easy review
     """
-    list_display = ('id', 'candidate_name', 'candidate_email', 'job', 'score', 'overall_fit', 'created_at')
-    list_filter = ('job', 'overall_fit', 'created_at')
+    list_display = ('id', 'candidate_name', 'candidate_email', 'job', 'score', 'overall_fit', 'status', 'created_at')
+    list_select_related = ('job',)  # Fetch job in the same query (avoids N+1)
+    raw_id_fields = ('job',)  # ID input instead of a dropdown of every job
+    list_filter = ('job', 'overall_fit', 'status', 'created_at')
     readonly_fields = ('extracted_text', 'feedback', 'structured_assessment', 'relevant_skills', 'missing_skills', 'overall_fit')
     fields = (
         ('candidate_name', 'candidate_email'),
@@ -74,3 +78,18 @@ class ResumeSubmissionAdmin(admin.ModelAdmin):
     )
     search_fields = ('candidate_name', 'candidate_email', 'job__title')
     ordering = ('-created_at',)
+
+    # Large text/JSON columns not shown in the list view
+    LIST_DEFERRED_FIELDS = ('feedback', 'structured_assessment')
+
+    def get_queryset(self, request):
+        """Skip loading heavy text/JSON columns on the changelist page.
+
+        The change form still loads every field, since it displays them.
+        """
+        qs = super().get_queryset(request).select_related('job')
+        match = request.resolver_match
+        changelist = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if match and match.url_name == changelist:
+            qs = qs.defer(*self.LIST_DEFERRED_FIELDS)
+        return qs
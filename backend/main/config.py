@@ -9,10 +9,17 @@ class Config:
     GROK_API_KEY = os.environ.get('GROK_API_KEY') or getattr(settings, 'GROK_API_KEY', '')
     GROK_API_URL = os.environ.get('GROK_API_URL') or getattr(settings, 'GROK_API_URL', 'https://api.grok.ai/v1/analyze')
     
+    # Computed once so the per-resume evaluation path does no extra work
+    GROK_CONFIGURED = bool(GROK_API_KEY and GROK_API_URL)
+    GROK_AUTH_HEADERS = {
+        'Authorization': f'Bearer {GROK_API_KEY}',
+        'Content-Type': 'application/json'
+    }
+    
     # Tesseract Settings
     TESSERACT_CMD = os.environ.get('TESSERACT_CMD')
     
     @classmethod
     def is_grok_configured(cls):
         """Check if Grok API is properly configured."""
-        return bool(cls.GROK_API_KEY and cls.GROK_API_URL)
+        return cls.GROK_CONFIGURED
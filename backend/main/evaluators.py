@@ -2,26 +2,118 @@
 
 This module provides multiple evaluation strategies:
 - Heuristic scoring (keyword matching, contact info, education, experience)
-- TF-IDF semantic similarity
+- Hashed term-frequency (cosine) semantic similarity
 - Optional AI-powered evaluation via Grok API
 - Hybrid scoring combining multiple strategies
 """
 
+import asyncio
+import atexit
 import re
+import threading
+from functools import lru_cache
 
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
+    import ahocorasick  # pyahocorasick: multi-keyword scanning in one pass
 except Exception:
-    TfidfVectorizer = None
-    cosine_similarity = None
-
-try:
-    import httpx
-except Exception:
-    httpx = None
+    ahocorasick = None
 
 from main.config import Config
+from main.optional import optional_import
+
+
+# Patterns used by the heuristic evaluator, compiled once at import
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9\+\#\-]{3,}")
+
+# Email and phone signals, matched together in a single pass
+_HEUR_RE = re.compile(
+    r"(?P<email>[\w\.-]+@[\w\.-]+)"
+    r"|(?P<phone>\+?\d[\d\s\-]{6,}\d)"
+)
+
+
+# Degree mentions that count as an education signal
+_EDU_KEYWORDS = ("bachelor", "master", "phd", "ba ", "bs ", "degree")
+
+
+def _build_edu_automaton():
+    """Build an Aho-Corasick automaton over the education keywords, if available."""
+    if not ahocorasick:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _EDU_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_EDU_AC = _build_edu_automaton()
+
+
+def _has_education(s):
+    """Check whether text mentions any education keyword.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed,
+    otherwise one substring search per keyword.
+    """
+    if _EDU_AC is not None:
+        return next(_EDU_AC.iter(s), None) is not None
+    return any(k in s for k in _EDU_KEYWORDS)
+
+
+def _token_set(s):
+    """Return the set of keyword tokens (3+ chars) in text, minus common stop words."""
+    return {w for w in _TOKEN_RE.findall(s) if w not in HeuristicEvaluator.STOP_WORDS}
+
+
+@lru_cache(maxsize=256)
+def _cached_job_tokens(job_text):
+    """Token set for a (lowercased) job description, memoized per job.
+
+    Many resumes are scored against the same job, so its tokens are only
+    extracted once. A frozenset is returned so the cached value can't be mutated.
+    """
+    return frozenset(_token_set(job_text))
+
+
+def _scan_signals(s):
+    """Scan text once for contact signals.
+
+    Returns:
+        tuple: (email_found, phone_found)
+    """
+    email_found = phone_found = False
+    for m in _HEUR_RE.finditer(s):
+        if m.lastgroup == 'email':
+            email_found = True
+        else:
+            phone_found = True
+        if email_found and phone_found:
+            break
+    return email_found, phone_found
+
+
+def _find_years(s):
+    r"""Return N from the first "N years" / "N+ years" mention, or 0 if none.
+
+    Equivalent to the regex ``(\d+)\+?\s+years`` but uses ``str.find`` and a
+    short backwards scan, since the word is usually absent or appears once.
+    """
+    idx = s.find('years')
+    while idx != -1:
+        j = idx
+        while j > 0 and s[j - 1].isspace():
+            j -= 1
+        if j < idx:
+            if j > 0 and s[j - 1] == '+':
+                j -= 1
+            end = j
+            while j > 0 and s[j - 1].isdecimal():
+                j -= 1
+            if j < end:
+                return int(s[j:end])
+        idx = s.find('years', idx + 5)
+    return 0
 
 
 class HeuristicEvaluator:
@@ -35,13 +127,13 @@ class HeuristicEvaluator:
         'experience': 20,           # Years of experience
     }
     
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         "the", "and", "for", "with", "that", "this", "from", "are", 
         "have", "has", "will", "your", "a", "an", "or", "to"
-    }
+    })
     
     @staticmethod
-    def evaluate(resume_text, job_text):
+    def evaluate(resume_text, job_text, already_lower=False):
         """Evaluate resume using heuristic scoring.
         
         Combines multiple factors with weighted scoring:
@@ -53,6 +145,8 @@ class HeuristicEvaluator:
         Args:
             resume_text (str): Resume text
             job_text (str): Job description text
+            already_lower (bool): Skip lowercasing when the caller has
+                                  already lowercased both texts
             
         Returns:
             dict: Evaluation results containing:
@@ -66,25 +160,21 @@ class HeuristicEvaluator:
             - Experience extraction looks for "X years" pattern
             - Score is clamped to [0, 100] range
         """
-        resume = (resume_text or '').lower()
-        job = (job_text or '').lower()
+        resume = resume_text or ''
+        job = job_text or ''
+        if not already_lower:
+            resume = resume.lower()
+            job = job.lower()
 
         feedback = []
         score = 0.0
         weights = {}
 
         # 1. Keywords overlap (weight 60)
-        def tokenize(s):
-            words = re.findall(r"[a-zA-Z0-9\+\#\-]{3,}", s)
-            return [w for w in words if w not in HeuristicEvaluator.STOP_WORDS]
-
-        job_tokens = set(tokenize(job))
-        resume_tokens = set(tokenize(resume))
-        if job_tokens:
-            overlap = job_tokens & resume_tokens
-            ratio = len(overlap) / len(job_tokens)
-        else:
-            ratio = 0.0
+        job_tokens = _cached_job_tokens(job)
+        resume_tokens = _token_set(resume)
+        overlap = job_tokens & resume_tokens
+        ratio = len(overlap) / len(job_tokens) if job_tokens else 0.0
         
         keyword_score = ratio * HeuristicEvaluator.WEIGHTS['keyword_overlap']
         score += keyword_score
@@ -92,8 +182,7 @@ class HeuristicEvaluator:
         feedback.append(f"Keyword match: {int(ratio*100)}% ({len(overlap)} of {len(job_tokens)} keywords)")
 
         # 2. Contact info presence (weight 10)
-        email_found = bool(re.search(r"[\w\.-]+@[\w\.-]+", resume))
-        phone_found = bool(re.search(r"\+?\d[\d\s\-]{6,}\d", resume))
+        email_found, phone_found = _scan_signals(resume)
         contact_points = 5 * int(email_found) + 5 * int(phone_found)
         score += contact_points
         weights['contact_info'] = contact_points
@@ -104,8 +193,7 @@ class HeuristicEvaluator:
             feedback.append("Add a contact phone number.")
 
         # 3. Education signal (weight 10)
-        edu_keywords = ["bachelor", "master", "phd", "ba ", "bs ", "degree"]
-        edu_found = any(k in resume for k in edu_keywords)
+        edu_found = _has_education(resume)
         edu_points = HeuristicEvaluator.WEIGHTS['education'] if edu_found else 0
         score += edu_points
         weights['education'] = edu_points
@@ -114,8 +202,7 @@ class HeuristicEvaluator:
             feedback.append("Mention your highest education/degree.")
 
         # 4. Experience years (weight 20)
-        exp_match = re.search(r"(\d+)\+?\s+years", resume)
-        years = int(exp_match.group(1)) if exp_match else 0
+        years = _find_years(resume)
         years_points = min(
             HeuristicEvaluator.WEIGHTS['experience'], 
             years * 2  # 2 points per year, capped at weight
@@ -136,16 +223,37 @@ class HeuristicEvaluator:
         }
 
 
+@lru_cache(maxsize=None)
+def _get_vectorizer():
+    """Return the shared HashingVectorizer, importing scikit-learn on first use.
+
+    The vectorizer is stateless (no fit step), so one instance serves all
+    semantic evaluations. Output rows are L2-normalized, so a dot product is
+    their cosine similarity. Returns None if scikit-learn is unavailable.
+    """
+    sklearn_text = optional_import('sklearn.feature_extraction.text')
+    if sklearn_text is None:
+        return None
+    return sklearn_text.HashingVectorizer(
+        n_features=2**18,
+        alternate_sign=False,
+        norm='l2',
+        stop_words='english'
+    )
+
+
 class SemanticEvaluator:
-    """TF-IDF based semantic similarity evaluation."""
+    """Hashed term-frequency semantic similarity evaluation."""
     
     @staticmethod
     def evaluate(job_text, resume_text):
-        """Compute TF-IDF cosine similarity between job description and resume.
+        """Compute cosine similarity between job description and resume.
         
-        This function uses scikit-learn to compute TF-IDF vectors for both
-        the job description and resume, then calculates cosine similarity.
+        This function uses scikit-learn's HashingVectorizer to compute
+        L2-normalized term-frequency vectors for both the job description
+        and resume, then takes their dot product (cosine similarity).
         This provides a semantic similarity score independent of keywords.
+        No vocabulary is fitted, so the vectorizer is shared across calls.
         
         Args:
             job_text (str): Job description text
@@ -163,7 +271,8 @@ class SemanticEvaluator:
             
             1.0 = perfect match, 0.0 = no similarity
         """
-        if not TfidfVectorizer or not cosine_similarity:
+        vectorizer = _get_vectorizer()
+        if vectorizer is None:
             return {
                 'score': None,
                 'similarity': None,
@@ -171,14 +280,11 @@ class SemanticEvaluator:
             }
         
         try:
-            # Create TF-IDF vectors (stop words removed, max 2000 features)
-            vect = TfidfVectorizer(stop_words='english', max_features=2000)
-            docs = [job_text or '', resume_text or '']
-            tfidf = vect.fit_transform(docs)
+            # Hash both documents into normalized vectors (stop words removed)
+            vecs = vectorizer.transform([job_text or '', resume_text or ''])
             
-            # Compute cosine similarity between job (index 0) and resume (index 1)
-            sim = cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0]
-            sim_score = float(sim)
+            # Dot product of unit vectors == cosine similarity of job (0) and resume (1)
+            sim_score = float((vecs[0] @ vecs[1].T).toarray()[0, 0])
             
             return {
                 'score': sim_score,
@@ -193,9 +299,74 @@ class SemanticEvaluator:
             }
 
 
+# Pooled HTTP client shared across Grok API calls (created on first use)
+_HTTPX_CLIENT = None
+_HTTPX_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client():
+    """Return the shared httpx client, creating it on first use.
+
+    Reusing one client keeps connections alive between evaluations instead
+    of paying a TCP/TLS handshake for every resume.
+    """
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is None:
+        with _HTTPX_CLIENT_LOCK:
+            if _HTTPX_CLIENT is None:
+                httpx = optional_import('httpx')
+                _HTTPX_CLIENT = httpx.Client(
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+                )
+                atexit.register(_HTTPX_CLIENT.close)
+    return _HTTPX_CLIENT
+
+
 class AIEvaluator:
     """AI-powered evaluation via Grok API."""
     
+    # Maximum Grok API requests in flight at once in evaluate_many; the rest
+    # wait their turn instead of timing out while queued for a connection
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    @staticmethod
+    def _unavailable():
+        """Result returned when the Grok API cannot be used or the call fails."""
+        return {
+            'score': None,
+            'feedback': None,
+            'assessment': None,
+            'available': False
+        }
+    
+    @staticmethod
+    def _build_request(job_text, resume_text):
+        """Build the JSON payload and headers for a Grok API call."""
+        payload = {
+            'job_description': job_text or '',
+            'resume_text': resume_text or ''
+        }
+        return payload, Config.GROK_AUTH_HEADERS
+    
+    @staticmethod
+    def _parse_response(resp):
+        """Convert a Grok API response into an evaluation result dict."""
+        if resp.status_code != 200:
+            return AIEvaluator._unavailable()
+        
+        data = resp.json()
+        score = data.get('score')
+        feedback = data.get('feedback') or data.get('comments') or ''
+        assessment = data.get('structured_assessment') or data.get('analysis') or data
+        
+        return {
+            'score': score,
+            'feedback': feedback,
+            'assessment': assessment,
+            'available': True
+        }
+    
     @staticmethod
     def evaluate(job_text, resume_text):
         """Call external Grok API to get AI-powered resume evaluation.
@@ -222,55 +393,94 @@ class AIEvaluator:
             
         Notes:
             - 30-second timeout for API requests
+            - Connections are pooled and reused across calls
             - Gracefully returns empty dict on failure
             - System falls back to local evaluation if Grok unavailable
         """
-        if not Config.is_grok_configured() or not httpx:
-            return {
-                'score': None,
-                'feedback': None,
-                'assessment': None,
-                'available': False
-            }
+        if not Config.GROK_CONFIGURED or not optional_import('httpx'):
+            return AIEvaluator._unavailable()
 
-        payload = {
-            'job_description': job_text or '',
-            'resume_text': resume_text or ''
-        }
-        headers = {
-            'Authorization': f'Bearer {Config.GROK_API_KEY}',
-            'Content-Type': 'application/json'
-        }
+        payload, headers = AIEvaluator._build_request(job_text, resume_text)
 
         try:
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(Config.GROK_API_URL, json=payload, headers=headers)
-                if resp.status_code != 200:
-                    return {
-                        'score': None,
-                        'feedback': None,
-                        'assessment': None,
-                        'available': False
-                    }
+            resp = _get_client().post(Config.GROK_API_URL, json=payload, headers=headers)
+            return AIEvaluator._parse_response(resp)
+        except Exception:
+            return AIEvaluator._unavailable()
+
+    @staticmethod
+    async def _apost(client, semaphore, job_text, resume_text):
+        """Send one resume to the Grok API on an async client."""
+        payload, headers = AIEvaluator._build_request(job_text, resume_text)
+        try:
+            async with semaphore:
+                resp = await client.post(Config.GROK_API_URL, json=payload, headers=headers)
+            return AIEvaluator._parse_response(resp)
+        except Exception:
+            return AIEvaluator._unavailable()
+
+    @staticmethod
+    async def evaluate_many_async(job_text, resume_texts):
+        """Async version of evaluate_many(), for code already running in an event loop.
+        
+        Args:
+            job_text (str): Job description text
+            resume_texts (list): Resume texts to evaluate
+            
+        Returns:
+            list: One result dict per resume, in input order, with the same
+                keys as evaluate()
+        """
+        resume_texts = list(resume_texts)
+        httpx = optional_import('httpx')
+        if not Config.GROK_CONFIGURED or not httpx:
+            return [AIEvaluator._unavailable() for _ in resume_texts]
+        if not resume_texts:
+            return []
+        
+        limit = AIEvaluator.MAX_CONCURRENT_REQUESTS
+        semaphore = asyncio.Semaphore(limit)
+        limits = httpx.Limits(max_keepalive_connections=limit, max_connections=limit)
+        async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+            return list(await asyncio.gather(*[
+                AIEvaluator._apost(client, semaphore, job_text, resume_text)
+                for resume_text in resume_texts
+            ]))
+
+    @staticmethod
+    def evaluate_many(job_text, resume_texts):
+        """Evaluate several resumes against one job description concurrently.
+        
+        Up to MAX_CONCURRENT_REQUESTS requests are in flight at once, so a
+        batch of resumes costs a fraction of the API round-trips of calling
+        evaluate() once per resume.
+        
+        Args:
+            job_text (str): Job description text
+            resume_texts (list): Resume texts to evaluate
+            
+        Returns:
+            list: One result dict per resume, in input order, with the same
+                keys as evaluate()
                 
-                data = resp.json()
-                score = data.get('score')
-                feedback = data.get('feedback') or data.get('comments') or ''
-                assessment = data.get('structured_assessment') or data.get('analysis') or data
+        Raises:
+            RuntimeError: If called while an event loop is running (e.g. in
+                          an async view); await evaluate_many_async() there
                 
-                return {
-                    'score': score,
-                    'feedback': feedback,
-                    'assessment': assessment,
-                    'available': True
-                }
-        except Exception:
-            return {
-                'score': None,
-                'feedback': None,
-                'assessment': None,
-                'available': False
-            }
+        Note:
+            Runs its own event loop, so it must be called from synchronous
+            code (e.g. a management command or regular Django view).
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                'AIEvaluator.evaluate_many() cannot run inside an event loop; '
+                'await AIEvaluator.evaluate_many_async() instead'
+            )
+        return asyncio.run(AIEvaluator.evaluate_many_async(job_text, resume_texts))
 
 
 class HybridEvaluator:
@@ -283,14 +493,22 @@ class HybridEvaluator:
         'semantic': 0.4,       # 40% semantic weight when combining
     }
     
+    # Semantic scores (0-100) at or beyond these bounds are clear-cut, so the
+    # heuristic pass is skipped and the semantic score is used directly
+    SEMANTIC_SHORTCUT = {
+        'high': 95.0,
+        'low': 5.0,
+    }
+    
     @staticmethod
     def evaluate(resume_text, job_text):
         """Evaluate resume using all available strategies.
         
         Strategy:
         1. Try Grok AI (if configured)
-        2. Fallback to local heuristic scoring
-        3. Add TF-IDF semantic similarity (if available)
+        2. Fallback to semantic similarity (if available); clear-cut
+           matches/non-matches return early with the semantic score
+        3. Add local heuristic scoring
         4. Combine for final score
         
         Args:
@@ -303,6 +521,7 @@ class HybridEvaluator:
                 - feedback (str): Human-readable feedback
                 - breakdown (dict): Scores from each evaluator
                 - method (str): Which method was used
+                  (grok, semantic, hybrid, or heuristic)
         """
         result = {
             'score': None,
@@ -320,19 +539,37 @@ class HybridEvaluator:
             result['method'] = 'grok'
             return result
         
-        # Fallback to heuristic + semantic
-        heuristic_result = HeuristicEvaluator.evaluate(resume_text, job_text)
+        # Fallback to semantic + heuristic; semantic runs first so clear-cut
+        # cases can skip the heuristic entirely
+        semantic_available = False
         semantic_result = SemanticEvaluator.evaluate(job_text, resume_text)
+        if semantic_result['available'] and semantic_result['score'] is not None:
+            semantic_available = True
+            s_score = semantic_result['score'] * 100.0
+            result['breakdown']['semantic'] = s_score
+            
+            shortcut = HybridEvaluator.SEMANTIC_SHORTCUT
+            if s_score >= shortcut['high'] or s_score <= shortcut['low']:
+                verdict = 'Strong' if s_score >= shortcut['high'] else 'Very weak'
+                result['score'] = round(max(0.0, min(100.0, s_score)), 2)
+                result['feedback'] = (
+                    f"{verdict} overall match with the job description.\n"
+                    f"Semantic similarity: {s_score:.1f}%"
+                )
+                result['method'] = 'semantic'
+                return result
+        
+        # Lowercase once for the heuristic; the vectorizer handles casing itself
+        resume_lc = (resume_text or '').lower()
+        job_lc = (job_text or '').lower()
+        heuristic_result = HeuristicEvaluator.evaluate(resume_lc, job_lc, already_lower=True)
         
         h_score = heuristic_result['score']
         result['breakdown']['heuristic'] = h_score
         result['feedback'] = heuristic_result['feedback']
         
-        # If TF-IDF available, combine scores
-        if semantic_result['available'] and semantic_result['score'] is not None:
-            s_score = semantic_result['score'] * 100.0
-            result['breakdown']['semantic'] = s_score
-            
+        # If semantic similarity available, combine scores
+        if semantic_available:
             # Combine: 60% heuristic + 40% semantic
             final_score = (
                 (HybridEvaluator.WEIGHTS['heuristic'] * h_score) + 
@@ -9,33 +9,19 @@ This module provides utilities for extracting text from:
 Each extraction method gracefully handles missing dependencies.
 """
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-# Optional imports with graceful fallbacks
-try:
-    import fitz  # PyMuPDF for PDF text extraction
-except Exception:
-    fitz = None
+from main.optional import optional_import
 
-try:
-    import docx  # python-docx for DOCX extraction
-except Exception:
-    docx = None
-
-try:
-    import pytesseract  # OCR engine
-except Exception:
-    pytesseract = None
-
-try:
-    from pdf2image import convert_from_path  # Convert PDF pages to images for OCR
-except Exception:
-    convert_from_path = None
-
-try:
-    from PIL import Image  # Image processing for OCR
-except Exception:
-    Image = None
+# Optional dependencies are imported on first use (see main.optional):
+# - fitz: PyMuPDF for PDF text extraction
+# - docx: python-docx for DOCX extraction
+# - pytesseract: OCR engine
+# - pdf2image: Convert PDF pages to images for OCR
+# - PIL.Image: Image processing for OCR
 
 
 class TextExtractor:
@@ -44,15 +30,25 @@ class TextExtractor:
     # Minimum text length threshold before trying OCR fallback
     MIN_TEXT_LENGTH = 120
     
-    # OCR DPI setting for better accuracy
-    OCR_DPI = 300
+    # Word count above which short native PDF text is still trusted (skips OCR)
+    MIN_WORD_COUNT = 40
+    
+    # OCR DPI setting (raise to 300 for low-quality scans)
+    OCR_DPI = 200
+    
+    # Tesseract options: LSTM engine only, single uniform block of text
+    OCR_CONFIG = '--oem 1 --psm 6'
+    
+    # File extensions routed to each extractor (tuples work with str.endswith)
+    WORD_EXTENSIONS = ('.docx', '.doc')
+    IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tiff')
     
     @staticmethod
     def extract_from_pdf(path_or_file):
         """Extract text from PDF using native PDF parsing (PyMuPDF).
         
         Args:
-            path_or_file (str or file): Path to PDF file or file object
+            path_or_file (str or bytes): Path to PDF file or its raw bytes
             
         Returns:
             str: Extracted text from all pages, empty string if extraction fails
@@ -61,73 +57,119 @@ class TextExtractor:
             This method works best for text-based PDFs. For scanned PDFs (images),
             use ocr_pdf() instead.
         """
+        fitz = optional_import('fitz')
         if not fitz:
             return ''
-        text = []
         try:
-            doc = fitz.open(path_or_file)
-            for page in doc:
-                text.append(page.get_text())
-            doc.close()
+            if isinstance(path_or_file, bytes):
+                doc = fitz.open(stream=path_or_file, filetype='pdf')
+            else:
+                doc = fitz.open(path_or_file)
+            try:
+                # Plain "text" mode is the cheapest extractor; pages are streamed
+                return "\n".join(page.get_text("text") for page in doc)
+            finally:
+                doc.close()
         except Exception:
             return ''
-        return "\n".join(text)
 
     @staticmethod
     def extract_from_docx(path_or_file):
         """Extract text from DOCX files (python-docx).
         
         Args:
-            path_or_file (str or file): Path to DOCX file or file object
+            path_or_file (str, bytes or file): Path to DOCX file, its raw bytes
+                                               or a file object
             
         Returns:
-            str: Extracted text from all paragraphs, empty string if extraction fails
+            str: Extracted text from all paragraphs (including those in tables),
+                 empty string if extraction fails
         """
+        docx = optional_import('docx')
         if not docx:
             return ''
         try:
+            qn = optional_import('docx.oxml.ns').qn
+            if isinstance(path_or_file, bytes):
+                path_or_file = io.BytesIO(path_or_file)
             doc = docx.Document(path_or_file)
-            return "\n".join(p.text for p in doc.paragraphs)
+            # Walk the XML once, collecting run text per paragraph, instead of
+            # building python-docx Paragraph/Run objects for every element
+            p_tag, r_tag, t_tag = qn('w:p'), qn('w:r'), qn('w:t')
+            tab_tag, br_tag = qn('w:tab'), qn('w:br')
+            paragraphs = []
+            for el in doc.element.body.iter(p_tag, t_tag, tab_tag, br_tag):
+                tag = el.tag
+                if tag == p_tag:
+                    paragraphs.append([])
+                elif not paragraphs:
+                    continue
+                elif tag == t_tag:
+                    paragraphs[-1].append(el.text or '')
+                elif el.getparent().tag != r_tag:
+                    continue  # e.g. tab stop definitions in paragraph properties
+                elif tag == tab_tag:
+                    paragraphs[-1].append('\t')
+                else:
+                    paragraphs[-1].append('\n')
+            return "\n".join("".join(parts) for parts in paragraphs)
         except Exception:
             return ''
 
     @staticmethod
-    def ocr_pdf(path):
+    def ocr_pdf(path_or_bytes):
         """Convert PDF pages to images and extract text using OCR (pytesseract).
         
         This is useful for scanned PDFs or PDFs where native text extraction
         yields little or no text.
         
         Args:
-            path (str): Path to PDF file
+            path_or_bytes (str or bytes): Path to PDF file or its raw bytes
             
         Returns:
             str: Extracted text from OCR on all pages, empty string if fails
             
         Note:
             Requires Tesseract OCR and Poppler to be installed on system.
-            This can be slow for multi-page PDFs (1-5 seconds per page).
+            This can be slow for multi-page PDFs (1-5 seconds per page), so
+            pages are OCR'd in parallel, one Tesseract process per CPU core.
         """
-        if not convert_from_path or not pytesseract:
+        pdf2image = optional_import('pdf2image')
+        pytesseract = optional_import('pytesseract')
+        if not pdf2image or not pytesseract:
             return ''
-        text_parts = []
         try:
-            # Convert PDF pages to images (300 DPI for better accuracy)
-            pages = convert_from_path(path, dpi=TextExtractor.OCR_DPI)
-            for page in pages:
-                # Run OCR on each page image
-                txt = pytesseract.image_to_string(page)
-                text_parts.append(txt)
+            # Convert PDF pages to images (Poppler renders pages in parallel;
+            # JPEG pages are far smaller than the default PPM)
+            if isinstance(path_or_bytes, bytes):
+                convert, source = pdf2image.convert_from_bytes, path_or_bytes
+            else:
+                convert, source = pdf2image.convert_from_path, path_or_bytes
+            pages = convert(
+                source,
+                dpi=TextExtractor.OCR_DPI,
+                fmt='jpeg',
+                thread_count=os.cpu_count() or 1
+            )
+            if not pages:
+                return ''
+            # Run OCR on each page image; Tesseract runs as a subprocess, so
+            # threads are enough to keep every core busy
+            workers = min(len(pages), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                ocr_page = partial(pytesseract.image_to_string, config=TextExtractor.OCR_CONFIG)
+                text_parts = list(executor.map(ocr_page, pages))
         except Exception:
             return ''
         return "\n".join(text_parts)
 
     @staticmethod
-    def ocr_image(path):
+    def ocr_image(path_or_bytes):
         """Extract text from image files using OCR (pytesseract).
         
         Args:
-            path (str): Path to image file (PNG, JPG, TIFF, etc.)
+            path_or_bytes (str or bytes): Path to image file (PNG, JPG, TIFF,
+                                          etc.) or its raw bytes
             
         Returns:
             str: Extracted text via OCR, empty string if fails
@@ -135,62 +177,100 @@ class TextExtractor:
         Note:
             Requires Tesseract OCR to be installed on system.
         """
+        Image = optional_import('PIL.Image')
+        pytesseract = optional_import('pytesseract')
         if not Image or not pytesseract:
             return ''
         try:
-            img = Image.open(path)
-            return pytesseract.image_to_string(img)
+            if isinstance(path_or_bytes, bytes):
+                path_or_bytes = io.BytesIO(path_or_bytes)
+            img = Image.open(path_or_bytes)
+            return pytesseract.image_to_string(img, config=TextExtractor.OCR_CONFIG)
         except Exception:
             return ''
 
     @staticmethod
     def extract_from_file(file_path, file_name):
+        """Extract text from a file on disk (see extract_from_stream).
+        
+        Args:
+            file_path (str): Full file path
+            file_name (str): File name with extension
+            
+        Returns:
+            str: Extracted text using best available method
+        """
+        with open(file_path, 'rb') as f:
+            return TextExtractor.extract_from_stream(f, file_name)
+
+    @staticmethod
+    def extract_from_stream(file, file_name):
         """Unified text extraction with intelligent fallbacks.
         
         Strategy:
         1. Try native extraction (PyMuPDF for PDF, python-docx for DOCX)
-        2. If text is short (<120 chars), try OCR fallback
+        2. If text is short (<120 chars and <40 words), try OCR fallback
         3. For image files, try OCR directly
         
         Args:
-            file_path (str): Full file path
+            file (file): Readable binary file object, e.g. an uploaded file
+                         (request.FILES) or an opened storage file
             file_name (str): File name with extension
             
         Returns:
             str: Extracted text using best available method
             
         Note:
+            The file is read into memory once and every extractor works on
+            those bytes, so no filesystem path is needed (works with
+            in-memory uploads and remote storage backends). The file is
+            rewound afterwards so it can still be saved.
+            
             This function gracefully degrades - if native extraction fails,
             it attempts OCR. If OCR is unavailable, returns available text.
         """
         text = ''
         lname = file_name.lower()
+        is_pdf = lname.endswith('.pdf')
+        is_image = lname.endswith(TextExtractor.IMAGE_EXTENSIONS)
+        
+        try:
+            file.seek(0)
+            data = file.read()
+            file.seek(0)
+        except Exception:
+            return ''
         
         try:
             # Try native extraction first
-            if lname.endswith('.pdf') and fitz:
-                text = TextExtractor.extract_from_pdf(file_path)
-            elif (lname.endswith('.docx') or lname.endswith('.doc')) and docx:
-                text = TextExtractor.extract_from_docx(file_path)
-            elif any(lname.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.tiff']):
-                text = TextExtractor.ocr_image(file_path)
+            if is_pdf and optional_import('fitz'):
+                text = TextExtractor.extract_from_pdf(data)
+            elif lname.endswith(TextExtractor.WORD_EXTENSIONS) and optional_import('docx'):
+                text = TextExtractor.extract_from_docx(data)
+            elif is_image:
+                text = TextExtractor.ocr_image(data)
             else:
-                # Try reading as plain text file
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
+                # Treat as a plain text file
+                text = data.decode('utf-8', errors='ignore')
         except Exception:
             text = ''
 
+        stripped = text.strip() if text else ''
+
         # If PDF yielded little text, try OCR
-        if (not text or len(text.strip()) < TextExtractor.MIN_TEXT_LENGTH) and lname.endswith('.pdf'):
-            ocr_text = TextExtractor.ocr_pdf(file_path)
-            if ocr_text and len(ocr_text.strip()) > len(text.strip()):
-                text = ocr_text
+        if (is_pdf
+                and len(stripped) < TextExtractor.MIN_TEXT_LENGTH
+                and stripped.count(' ') < TextExtractor.MIN_WORD_COUNT):
+            ocr_text = TextExtractor.ocr_pdf(data)
+            ocr_stripped = ocr_text.strip() if ocr_text else ''
+            if len(ocr_stripped) > len(stripped):
+                text, stripped = ocr_text, ocr_stripped
 
         # If image yielded little text, retry OCR
-        if (not text or len(text.strip()) < TextExtractor.MIN_TEXT_LENGTH) and any(lname.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.tiff']):
-            ocr_text = TextExtractor.ocr_image(file_path)
-            if ocr_text and len(ocr_text.strip()) > len(text.strip()):
-                text = ocr_text
+        if is_image and len(stripped) < TextExtractor.MIN_TEXT_LENGTH:
+            ocr_text = TextExtractor.ocr_image(data)
+            ocr_stripped = ocr_text.strip() if ocr_text else ''
+            if len(ocr_stripped) > len(stripped):
+                text, stripped = ocr_text, ocr_stripped
 
         return text
@@ -4,9 +4,14 @@ This module defines the core data models:
 - TestItem: Legacy test model (placeholder)
 - JobPosting: Job postings with title, description, location, and required skills
 - ResumeSubmission: Resume submissions linked to jobs with evaluation results
+- ResumeText: Full extracted resume text, stored apart from the submission row
 """
 
-from django.db import models
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.utils import timezone
 
 
 class TestItem(models.Model):
@@ -18,9 +23,6 @@ class TestItem(models.Model):
         return self.description
 
 
-
-
-
 class JobPosting(models.Model):
     """Represents a job posting created by an admin user.
     
@@ -54,7 +56,7 @@ class JobPosting(models.Model):
         blank=True,
         help_text="Comma-separated list of required skills (e.g., Python, Django, REST API)"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
         ordering = ['-created_at']
@@ -64,6 +66,30 @@ class JobPosting(models.Model):
     def __str__(self):
         return f"{self.title} at {self.company}"
     
+    # Cache settings for evaluation lookups (invalidated on save/delete, see signals.py)
+    EVALUATION_CACHE_TIMEOUT = 300
+    
+    @staticmethod
+    def evaluation_cache_key(pk):
+        """Cache key for a job's evaluation fields."""
+        return f'job:{pk}'
+    
+    @classmethod
+    def get_evaluation_fields(cls, pk):
+        """Return (description, required_skills) for a job, cached.
+        
+        Applications for the same job hit the cache instead of the database.
+        Only the two strings are cached, not the model instance.
+        
+        Raises:
+            JobPosting.DoesNotExist: If no job has this primary key
+        """
+        return cache.get_or_set(
+            cls.evaluation_cache_key(pk),
+            lambda: tuple(cls.objects.values_list('description', 'required_skills').get(pk=pk)),
+            cls.EVALUATION_CACHE_TIMEOUT
+        )
+    
     def get_skills_list(self):
         """Return required skills as a list."""
         if not self.required_skills:
@@ -79,13 +105,15 @@ class ResumeSubmission(models.Model):
         candidate_name: Name of the candidate
         candidate_email: Email of the candidate
         file: Uploaded resume file (PDF, DOCX, etc.)
-        extracted_text: Full text extracted from resume via OCR or text extraction
+        extracted_text: Full extracted text (read-only; stored in ResumeText so
+                        the submission row stays small)
         structured_assessment: Detailed assessment from Grok API or local evaluator (JSON)
         score: Overall match score (0-100)
         feedback: Text feedback about the resume and match
         relevant_skills: List of skills from resume matching job requirements (JSON)
         missing_skills: List of required skills not found in resume (JSON)
         overall_fit: Categorical assessment (excellent/good/fair/poor)
+        status: Processing state (processing/completed/failed)
         created_at: Timestamp when the submission was created
     """
     OVERALL_FIT_CHOICES = [
@@ -95,6 +123,28 @@ class ResumeSubmission(models.Model):
         ('poor', 'Poor')
     ]
     
+    # Columns filled in by evaluation, after the submission row is created
+    EVALUATION_FIELDS = [
+        'score', 'feedback', 'relevant_skills',
+        'missing_skills', 'overall_fit', 'structured_assessment', 'status'
+    ]
+    
+    STATUS_PROCESSING = 'processing'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed')
+    ]
+    
+    # Seconds after which a submission still 'processing' is considered
+    # lost (e.g. its background worker was restarted) and reported as failed
+    PROCESSING_TIMEOUT = 30 * 60
+    
+    # Rows per INSERT statement in bulk_ingest
+    BULK_BATCH_SIZE = 500
+    
     job = models.ForeignKey(
         JobPosting,
         null=True,
@@ -105,19 +155,125 @@ class ResumeSubmission(models.Model):
     candidate_name = models.CharField(max_length=255, blank=True)
     candidate_email = models.EmailField(blank=True)
     file = models.FileField(upload_to='resumes/')
-    extracted_text = models.TextField(blank=True)
     structured_assessment = models.JSONField(null=True, blank=True)
     score = models.FloatField(null=True, blank=True)
     feedback = models.TextField(blank=True)
     relevant_skills = models.JSONField(null=True, blank=True)
     missing_skills = models.JSONField(null=True, blank=True)
     overall_fit = models.CharField(max_length=50, blank=True, choices=OVERALL_FIT_CHOICES)
-    created_at = models.DateTimeField(auto_now_add=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_COMPLETED)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Resume Submission'
         verbose_name_plural = 'Resume Submissions'
+        indexes = [
+            # Per-job submission lists, newest first
+            models.Index(fields=['job', '-created_at']),
+            # Admin filtering by fit category
+            models.Index(fields=['overall_fit']),
+            # PostgreSQL-only GIN indexes on the skill JSON fields are created
+            # after migrate (see signals.create_skill_gin_indexes), so the
+            # migration state doesn't depend on the database backend. They
+            # are outside migration state: not shown by sqlmigrate and never
+            # dropped automatically. Move them into a vendor-guarded RunSQL
+            # migration once migrations are tracked in the repo.
+        ]
 
     def __str__(self):
         return f"ResumeSubmission {self.pk} - {self.candidate_name or self.file.name}"
+
+    @property
+    def extracted_text(self):
+        """Full extracted resume text, loaded from ResumeText on access."""
+        try:
+            return self.text.text
+        except ResumeText.DoesNotExist:
+            return ''
+
+    def fail_if_stale(self):
+        """Mark this submission failed if it has been processing too long.
+        
+        Returns:
+            bool: True if the submission was marked failed
+        """
+        if self.status != self.STATUS_PROCESSING:
+            return False
+        cutoff = timezone.now() - timedelta(seconds=self.PROCESSING_TIMEOUT)
+        if self.created_at >= cutoff:
+            return False
+        # Conditional update, so a result saved meanwhile is not overwritten
+        updated = ResumeSubmission.objects.filter(
+            pk=self.pk, status=self.STATUS_PROCESSING
+        ).update(status=self.STATUS_FAILED)
+        if updated:
+            self.status = self.STATUS_FAILED
+        return bool(updated)
+
+    @classmethod
+    def bulk_ingest(cls, rows):
+        """Insert many submissions with batched multi-row INSERTs.
+        
+        Meant for backlogs such as importing earlier applicants or replaying
+        evaluations, where one create() per row would cost one round-trip
+        per row (two with its extracted text).
+        
+        Args:
+            rows (iterable): Dicts of ResumeSubmission field values; an
+                             optional 'extracted_text' key is stored as the
+                             submission's ResumeText
+            
+        Returns:
+            list: The created ResumeSubmission objects
+            
+        Notes:
+            - Everything is inserted in one transaction, BULK_BATCH_SIZE rows
+              per statement
+            - save() and post_save signals are skipped (as with bulk_create)
+            - Extracted texts need the new primary keys, which bulk_create
+              sets on PostgreSQL, SQLite and MariaDB
+        """
+        submissions, texts = [], []
+        for row in rows:
+            row = dict(row)
+            texts.append(row.pop('extracted_text', None))
+            submissions.append(cls(**row))
+        
+        with transaction.atomic():
+            created = cls.objects.bulk_create(submissions, batch_size=cls.BULK_BATCH_SIZE)
+            ResumeText.objects.bulk_create(
+                [
+                    ResumeText(submission=submission, text=text)
+                    for submission, text in zip(created, texts)
+                    if text is not None
+                ],
+                batch_size=cls.BULK_BATCH_SIZE
+            )
+        return created
+
+
+class ResumeText(models.Model):
+    """Full text extracted from a resume via OCR or text extraction.
+    
+    Kept in its own table so that listing, sorting and updating submissions
+    never reads or rewrites the (potentially hundreds of KB) text blob.
+    
+    Fields:
+        submission: The submission this text belongs to (also the primary key)
+        text: Full extracted text
+    """
+    submission = models.OneToOneField(
+        ResumeSubmission,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='text'
+    )
+    text = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = 'Resume Text'
+        verbose_name_plural = 'Resume Texts'
+
+    def __str__(self):
+        return f"ResumeText for submission {self.submission_id}"
@@ -0,0 +1,27 @@
+"""Lazy loading of optional, heavy third-party dependencies.
+
+Modules such as scikit-learn, httpx, PyMuPDF or pytesseract are only needed
+when a resume is actually extracted or scored. Importing them on first use
+keeps Django worker start-up fast and memory low for requests that never
+touch them.
+"""
+
+import importlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def optional_import(module_name):
+    """Import a module on first use and cache the result.
+
+    Args:
+        module_name (str): Dotted module path (e.g. 'sklearn.feature_extraction.text')
+
+    Returns:
+        module or None: The imported module, or None if it is not installed
+                        or fails to import
+    """
+    try:
+        return importlib.import_module(module_name)
+    except Exception:
+        return None
@@ -0,0 +1,41 @@
+"""HTTP response helpers for the API views.
+
+OrjsonResponse serializes with orjson when it is installed. orjson is
+implemented in Rust and is several times faster than the stdlib json encoder
+that JsonResponse uses, which matters for large list payloads.
+"""
+
+import datetime
+import json
+
+from django.http import HttpResponse
+
+from main.optional import optional_import
+
+
+def _json_default(obj):
+    """Serialize dates/times like orjson does (ISO 8601), for the stdlib fallback."""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonResponse(HttpResponse):
+    """JSON response encoded with orjson (stdlib json if orjson is missing).
+
+    Unlike JsonResponse, datetime values can be passed as-is: they are
+    written as ISO 8601 strings.
+
+    Args:
+        data (dict): JSON-serializable data
+        **kwargs: Passed on to HttpResponse (e.g. status)
+    """
+
+    def __init__(self, data, **kwargs):
+        orjson = optional_import('orjson')
+        if orjson is not None:
+            content = orjson.dumps(data)
+        else:
+            content = json.dumps(data, default=_json_default)
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=content, **kwargs)
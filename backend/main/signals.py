@@ -0,0 +1,61 @@
+"""Signal handlers for the main app.
+
+Keeps cached job data (see JobPosting.get_evaluation_fields) in sync with
+the database when a job posting is edited or deleted, and adds the
+PostgreSQL-only skill indexes after migrations run.
+"""
+
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models.signals import post_save, post_delete, post_migrate
+from django.dispatch import receiver
+
+from .models import JobPosting, ResumeSubmission
+
+
+# ResumeSubmission JSON fields that get a GIN index on PostgreSQL
+SKILL_GIN_INDEXED_FIELDS = ('relevant_skills', 'missing_skills')
+
+
+@receiver(post_save, sender=JobPosting)
+@receiver(post_delete, sender=JobPosting)
+def invalidate_job_cache(sender, instance, **kwargs):
+    """Drop the cached evaluation fields of a changed or deleted job.
+
+    Deferred until the transaction commits: deleting earlier would let a
+    concurrent request re-cache the old committed row before the change
+    becomes visible.
+    """
+    key = JobPosting.evaluation_cache_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+@receiver(post_migrate)
+def create_skill_gin_indexes(sender, using, **kwargs):
+    """Create GIN indexes on the skill JSON fields (PostgreSQL only).
+
+    Enables indexed lookups such as relevant_skills__contains=['python'].
+    Other databases (e.g. the default SQLite) don't support GIN. The indexes
+    are created here rather than in Meta.indexes so that makemigrations
+    produces the same history on every backend; IF NOT EXISTS makes this
+    safe to run after every migrate.
+
+    Django's migration state doesn't know about these indexes: sqlmigrate
+    doesn't show them and migrations never drop them (remove them by hand
+    with DROP INDEX if the fields change). Once the repo tracks migrations,
+    they should move into a RunSQL migration guarded on the vendor.
+    """
+    if sender.name != 'main':
+        return
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    qn = connection.ops.quote_name
+    table = ResumeSubmission._meta.db_table
+    with connection.cursor() as cursor:
+        for field in SKILL_GIN_INDEXED_FIELDS:
+            column = ResumeSubmission._meta.get_field(field).column
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {qn(f"submission_{field}_gin")} '
+                f'ON {qn(table)} USING gin ({qn(column)})'
+            )
@@ -7,12 +7,20 @@ This module provides utilities for:
 - Determining overall fit category
 """
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from main.optional import optional_import
+
 
 class SkillMatcher:
     """Handles skill detection and matching between resumes and job requirements."""
     
     # Predefined dictionary of 60+ skills
-    SKILL_DATABASE = {
+    SKILL_DATABASE = frozenset({
         # Programming Languages
         'python', 'java', 'javascript', 'csharp', 'c++', 'ruby', 'php', 'swift', 
         'kotlin', 'rust', 'go', 'typescript', 'scala', 'r',
@@ -48,7 +56,23 @@ class SkillMatcher:
         # Soft Skills
         'communication', 'leadership', 'problem solving', 'teamwork', 
         'project management', 'mentoring', 'collaboration'
-    }
+    })
+    
+    # Fixed skill order; a set of skills is an int bitmap over these indices
+    SKILLS_TUPLE = tuple(sorted(SKILL_DATABASE))
+    SKILL_TO_BIT = {skill: 1 << i for i, skill in enumerate(SKILLS_TUPLE)}
+    
+    # Single compiled pattern matching any skill as a whole word (built below)
+    _SKILL_RE = None
+    
+    # Minimum rapidfuzz ratio (0-100) for a fuzzy match of a required skill
+    # that is not in SKILL_DATABASE (e.g. 'pyhton' vs 'python')
+    FUZZY_MATCH_CUTOFF = 90
+    
+    # Number of recent evaluate() results kept, keyed by (required skills, text digest)
+    EVALUATE_CACHE_SIZE = 1024
+    _evaluate_cache = OrderedDict()
+    _evaluate_cache_lock = threading.Lock()
     
     # Overall fit thresholds (percentage of required skills matched)
     FIT_THRESHOLDS = {
@@ -58,7 +82,7 @@ class SkillMatcher:
     }
     
     @staticmethod
-    def extract_skills(text):
+    def extract_skills(text, text_lower=None):
         """Extract mentioned skills from resume text.
         
         The function searches for predefined skills in the resume text 
@@ -66,22 +90,59 @@ class SkillMatcher:
         
         Args:
             text (str): Resume text
+            text_lower (str, optional): Precomputed text.lower(), to avoid
+                                        lowercasing the text again
             
         Returns:
             list: Sorted list of unique detected skills
             
         Notes:
-            - Simple substring matching (not regex)
-            - Case-insensitive matching
+            - One precompiled regex alternation over all skills, so the
+              text is scanned once
+            - Skills only match as whole words (e.g. 'r' does not match
+              inside 'react'); longer skills are tried first
+            - Case-insensitive matching (the lowercased text is scanned with
+              a case-sensitive pattern, which is faster than re.IGNORECASE)
             - More sophisticated methods (NLP, entity recognition) can 
               improve accuracy in future versions
         """
-        text_lower = text.lower()
-        found_skills = []
-        for skill in SkillMatcher.SKILL_DATABASE:
-            if skill in text_lower:
-                found_skills.append(skill)
-        return sorted(list(set(found_skills)))
+        if text_lower is None:
+            text_lower = text.lower()
+        return SkillMatcher.skills_from_mask(SkillMatcher.extract_skill_mask(text_lower))
+
+    @staticmethod
+    def extract_skill_mask(text_lower):
+        """Detect skills in lowercased text as a bitmap over SKILLS_TUPLE.
+        
+        Args:
+            text_lower (str): Lowercased resume text
+            
+        Returns:
+            int: Bitmap with bit i set if SKILLS_TUPLE[i] was found
+        """
+        skill_to_bit = SkillMatcher.SKILL_TO_BIT
+        mask = 0
+        for skill in SkillMatcher._SKILL_RE.findall(text_lower):
+            mask |= skill_to_bit[skill]
+        return mask
+
+    @staticmethod
+    def skills_from_mask(mask):
+        """List the skills whose bits are set, in sorted (SKILLS_TUPLE) order.
+        
+        Args:
+            mask (int): Bitmap over SKILLS_TUPLE
+            
+        Returns:
+            list: Sorted skill names
+        """
+        skills = SkillMatcher.SKILLS_TUPLE
+        found = []
+        while mask:
+            low = mask & -mask  # lowest set bit
+            found.append(skills[low.bit_length() - 1])
+            mask ^= low
+        return found
 
     @staticmethod
     def evaluate(required_skills_str, resume_text):
@@ -111,6 +172,10 @@ class SkillMatcher:
             - Good (60-79%): Good coverage of required skills
             - Fair (40-59%): Some skills present, some missing
             - Poor (<40%): Limited skill match
+            
+        Notes:
+            - Results are memoized per (required skills, resume text digest),
+              so re-applying with the same resume costs one hash of the text
         """
         if not required_skills_str or not resume_text:
             return {
@@ -120,8 +185,39 @@ class SkillMatcher:
                 'fit_percentage': 0.0
             }
         
-        # Parse comma-separated required skills
-        required = [s.strip().lower() for s in required_skills_str.split(',') if s.strip()]
+        # Key on a digest rather than the text itself, so cached entries
+        # don't keep whole resumes in memory
+        key = (required_skills_str, _text_digest(resume_text))
+        cache = SkillMatcher._evaluate_cache
+        with SkillMatcher._evaluate_cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+        if result is None:
+            result = SkillMatcher._evaluate_uncached(required_skills_str, resume_text)
+            with SkillMatcher._evaluate_cache_lock:
+                cache[key] = result
+                if len(cache) > SkillMatcher.EVALUATE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        
+        # Hand out copies so callers can't mutate the cached lists
+        return {
+            **result,
+            'relevant_skills': list(result['relevant_skills']),
+            'missing_skills': list(result['missing_skills']),
+        }
+
+    @staticmethod
+    def clear_cache():
+        """Drop memoized evaluate() results (e.g. after changing SKILL_DATABASE)."""
+        with SkillMatcher._evaluate_cache_lock:
+            SkillMatcher._evaluate_cache.clear()
+
+    @staticmethod
+    def _evaluate_uncached(required_skills_str, resume_text):
+        """Compute evaluate() results; see evaluate() for arguments and return value."""
+        # Parsed once per distinct required-skills string (i.e. per job)
+        required, required_mask = _parse_required_skills(required_skills_str)
         if not required:
             return {
                 'relevant_skills': [],
@@ -130,30 +226,28 @@ class SkillMatcher:
                 'fit_percentage': 0.0
             }
         
-        # Extract skills found in resume
-        found_skills = SkillMatcher.extract_skills(resume_text)
-        
-        # Match found skills against required
-        relevant = []
-        for skill in found_skills:
-            for req in required:
-                # Allow partial matches (substring matching)
-                if req in skill or skill in req:
-                    if skill not in relevant:
-                        relevant.append(skill)
-                    break
-        
-        # Find missing skills
-        missing = []
-        for req in required:
-            req_lower = req.lower()
-            found = False
-            for found_skill in found_skills:
-                if req_lower in found_skill or found_skill in req_lower:
-                    found = True
-                    break
-            if not found:
-                missing.append(req_lower)
+        # Extract skills found in resume (as a bitmap over SKILLS_TUPLE)
+        found_mask = SkillMatcher.extract_skill_mask(resume_text.lower())
+        
+        # Exact matches: one AND of the two bitmaps
+        exact_mask = found_mask & required_mask
+        exact = SkillMatcher.skills_from_mask(exact_mask)
+        relevant_set = set(exact)
+        matched = set(exact)
+        
+        # Known skills are decided by the bitmap alone ('java' does not
+        # satisfy 'javascript'). Free-form required skills that aren't in
+        # SKILL_DATABASE (e.g. 'python3') may match found skills partially.
+        skill_to_bit = SkillMatcher.SKILL_TO_BIT
+        free_form = [req for req in required if req not in skill_to_bit]
+        if free_form:
+            found = SkillMatcher.skills_from_mask(found_mask)
+            for req, skill in SkillMatcher._partial_matches(free_form, found):
+                relevant_set.add(skill)
+                matched.add(req)
+        
+        relevant = sorted(relevant_set)
+        missing = [req for req in required if req not in matched]
         
         # Calculate fit percentage and category
         if not required:
@@ -178,3 +272,76 @@ class SkillMatcher:
             'overall_fit': fit,
             'fit_percentage': fit_pct
         }
+
+    @staticmethod
+    def _partial_matches(queries, choices):
+        """Yield (query, choice) pairs that partially match.
+        
+        A pair matches if either skill is a substring of the other or, when
+        rapidfuzz is installed, their ratio (which penalizes length
+        differences) reaches FUZZY_MATCH_CUTOFF. Only used for free-form
+        required skills: known skills are decided by the skill pattern, and
+        similar-looking known skills (e.g. 'java' and 'javascript', 'mysql'
+        and 'postgresql') are different skills.
+        
+        Args:
+            queries (list): Lowercase free-form skills to match
+            choices (list): Lowercase skills to match against
+            
+        Yields:
+            tuple: (query, choice) for every matching pair
+        """
+        if not queries or not choices:
+            return
+        
+        rf_fuzz = optional_import('rapidfuzz.fuzz')
+        cutoff = SkillMatcher.FUZZY_MATCH_CUTOFF
+        for query in queries:
+            for choice in choices:
+                if (query in choice or choice in query
+                        or (rf_fuzz and rf_fuzz.ratio(query, choice, score_cutoff=cutoff))):
+                    yield query, choice
+
+
+@lru_cache(maxsize=256)
+def _parse_required_skills(required_skills_str):
+    """Parse comma-separated required skills, memoized per job's skills string.
+
+    Returns:
+        tuple: (skills, mask) - normalized lowercase skills in their
+               original order with duplicates dropped (a tuple, so the
+               cached value can't be mutated), and the bitmap over
+               SkillMatcher.SKILLS_TUPLE of those that are known skills
+    """
+    skills = tuple(dict.fromkeys(
+        s.strip().lower() for s in required_skills_str.split(',') if s.strip()
+    ))
+    skill_to_bit = SkillMatcher.SKILL_TO_BIT
+    mask = 0
+    for skill in skills:
+        mask |= skill_to_bit.get(skill, 0)
+    return skills, mask
+
+
+def _text_digest(text):
+    """Fast 64-bit digest of text (xxhash when installed, else BLAKE2b)."""
+    data = text.encode('utf-8', 'surrogatepass')
+    xxhash = optional_import('xxhash')
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def _compile_skill_pattern(skills):
+    """Compile one pattern matching any (lowercase) skill as a whole word.
+
+    Skills are sorted longest first so the longest match wins
+    ('machine learning' before 'learning'). Lookarounds are used instead of
+    \\b because several skills start or end with non-word characters
+    (e.g. 'c++').
+    """
+    alternation = '|'.join(map(re.escape, sorted(skills, key=len, reverse=True)))
+    return re.compile(r'(?<!\w)(' + alternation + r')(?!\w)')
+
+
+SkillMatcher._SKILL_RE = _compile_skill_pattern(SkillMatcher.SKILL_DATABASE)
@@ -0,0 +1,184 @@
+"""Resume submission processing, runnable inline or in the background.
+
+Extracting text (PDF parsing, OCR) and scoring (possibly a Grok API call)
+can take seconds to minutes per resume. This module holds that work so the
+API views can either run it inline or hand it to a background worker pool
+and return immediately, letting the client poll for the result.
+
+The background pool is an in-process thread pool: the heavy parts (Tesseract,
+Poppler, HTTP calls) run outside the GIL, and no message broker is required.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+
+from .models import ResumeSubmission, ResumeText
+from .extractors import TextExtractor
+from .skills import SkillMatcher
+from .evaluators import HybridEvaluator
+
+
+# Maximum number of submissions processed concurrently in the background
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='resume-eval')
+
+
+def _evaluation_fields(extracted_text, job_desc, required_skills):
+    """Score extracted resume text and return the submission field values.
+
+    Args:
+        extracted_text (str): Text extracted from the resume
+        job_desc (str): Job description text to score against
+        required_skills (str): Comma-separated required skills ('' to skip
+                               skill matching)
+
+    Returns:
+        dict: Values for ResumeSubmission.EVALUATION_FIELDS
+    """
+    # Evaluate skills if job has requirements
+    relevant_skills, missing_skills, overall_fit = [], [], ''
+    if required_skills:
+        skill_result = SkillMatcher.evaluate(required_skills, extracted_text)
+        relevant_skills = skill_result['relevant_skills']
+        missing_skills = skill_result['missing_skills']
+        overall_fit = skill_result['overall_fit']
+
+    # Perform hybrid evaluation (tries Grok, falls back to local)
+    eval_result = HybridEvaluator.evaluate(extracted_text, job_desc)
+
+    return {
+        'score': eval_result['score'],
+        'feedback': eval_result['feedback'],
+        'relevant_skills': relevant_skills if relevant_skills else None,
+        'missing_skills': missing_skills if missing_skills else None,
+        'overall_fit': overall_fit,
+        'structured_assessment': {
+            'method': eval_result['method'],
+            'breakdown': eval_result.get('breakdown', {}),
+        },
+        'status': ResumeSubmission.STATUS_COMPLETED,
+    }
+
+
+def create_submission(resume_file, job_desc, required_skills, **fields):
+    """Extract and evaluate an uploaded resume, then store it in one INSERT.
+
+    Text is extracted straight from the upload (no re-open from storage),
+    so the submission row is written once with its results instead of
+    being inserted and then updated.
+
+    Args:
+        resume_file (UploadedFile): Uploaded resume (request.FILES entry)
+        job_desc (str): Job description text to score against
+        required_skills (str): Comma-separated required skills ('' to skip
+                               skill matching)
+        **fields: Other ResumeSubmission fields (job_id, candidate_name, ...)
+
+    Returns:
+        ResumeSubmission: The saved submission, with status 'completed'
+    """
+    extracted_text = TextExtractor.extract_from_stream(resume_file, resume_file.name)
+    evaluation = _evaluation_fields(extracted_text, job_desc, required_skills)
+    with transaction.atomic():
+        submission = ResumeSubmission.objects.create(file=resume_file, **fields, **evaluation)
+        ResumeText.objects.create(submission=submission, text=extracted_text)
+    return submission
+
+
+def process_submission(submission, job_desc, required_skills):
+    """Extract, evaluate and save an already stored resume submission.
+
+    Args:
+        submission (ResumeSubmission): Saved submission with an uploaded file
+        job_desc (str): Job description text to score against
+        required_skills (str): Comma-separated required skills ('' to skip
+                               skill matching)
+
+    Returns:
+        bool: True if the results were saved; False if the submission was
+              no longer 'processing' (e.g. already reported failed as stale),
+              in which case it is left untouched
+    """
+    # Read through the storage API rather than a filesystem path
+    with submission.file.open('rb') as f:
+        extracted_text = TextExtractor.extract_from_stream(f, submission.file.name)
+    # Full text lives in its own table; the submission row only gets results
+    ResumeText.objects.update_or_create(submission=submission, defaults={'text': extracted_text})
+
+    for name, value in _evaluation_fields(extracted_text, job_desc, required_skills).items():
+        setattr(submission, name, value)
+    # Only write the columns computed here (the row was inserted by the view),
+    # and only while the row is still 'processing' so a failed submission is
+    # never flipped back to 'completed'
+    return bool(ResumeSubmission.objects.filter(
+        pk=submission.pk, status=ResumeSubmission.STATUS_PROCESSING
+    ).update(**{name: getattr(submission, name) for name in ResumeSubmission.EVALUATION_FIELDS}))
+
+
+def _process_in_background(submission_id, job_desc, required_skills):
+    """Worker entry point: load the submission by ID and process it.
+
+    Submissions that are no longer 'processing' when the job starts (e.g.
+    reported failed as stale while queued) are skipped.
+    """
+    try:
+        submission = ResumeSubmission.objects.filter(
+            pk=submission_id, status=ResumeSubmission.STATUS_PROCESSING
+        ).first()
+        if submission is None:
+            return
+        try:
+            process_submission(submission, job_desc, required_skills)
+        except Exception:
+            ResumeSubmission.objects.filter(
+                pk=submission_id, status=ResumeSubmission.STATUS_PROCESSING
+            ).update(status=ResumeSubmission.STATUS_FAILED)
+    finally:
+        # Worker threads get their own DB connection; don't leak it
+        connection.close()
+
+
+def enqueue_submission(submission, job_desc, required_skills):
+    """Schedule a submission for background processing and return immediately.
+
+    The job is handed to the pool only once the current transaction commits,
+    so the worker always sees the new row. Jobs live in this process's
+    memory: ones still queued or running when the process stops are lost,
+    and their rows are later reported as failed (see
+    ResumeSubmission.PROCESSING_TIMEOUT).
+
+    Args:
+        submission (ResumeSubmission): Saved submission with status 'processing'
+        job_desc (str): Job description text to score against
+        required_skills (str): Comma-separated required skills
+    """
+    transaction.on_commit(lambda: _EXECUTOR.submit(
+        _process_in_background, submission.pk, job_desc, required_skills
+    ))
+
+
+def submission_payload(submission):
+    """Build the API response body for a processed submission.
+
+    Args:
+        submission (ResumeSubmission): Submission with evaluation results
+
+    Returns:
+        dict: JSON-serializable evaluation results (see views.evaluate_resume)
+    """
+    assessment = submission.structured_assessment or {}
+    return {
+        'id': submission.pk,
+        'status': submission.status,
+        'score': submission.score,
+        'feedback': submission.feedback,
+        'evaluation_method': assessment.get('method'),
+        'breakdown': assessment.get('breakdown', {}),
+        'relevant_skills': submission.relevant_skills or [],
+        'missing_skills': submission.missing_skills or [],
+        'overall_fit': submission.overall_fit or 'poor',
+        'structured_assessment': submission.structured_assessment
+    }
@@ -1,3 +1,182 @@
-from django.test import TestCase
+import random
+import re
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import tasks
+from .evaluators import _find_years
+from .models import JobPosting, ResumeSubmission
+from .skills import SkillMatcher
+
+
+class SkillMatcherPartialMatchTests(SimpleTestCase):
+    """Partial matching must not let unrelated skills satisfy each other."""
+
+    def test_rest_api_not_matched_by_rust(self):
+        result = SkillMatcher.evaluate('REST API', 'I write Rust every day')
+        self.assertEqual(result['relevant_skills'], [])
+        self.assertEqual(result['missing_skills'], ['rest api'])
+        self.assertEqual(result['overall_fit'], 'poor')
+
+    def test_aws_not_matched_by_pandas(self):
+        result = SkillMatcher.evaluate('AWS', 'Data analysis with pandas on Windows')
+        self.assertEqual(result['relevant_skills'], [])
+        self.assertEqual(result['missing_skills'], ['aws'])
+
+    def test_java_does_not_satisfy_javascript(self):
+        result = SkillMatcher.evaluate('JavaScript', 'Java developer')
+        self.assertEqual(result['relevant_skills'], [])
+        self.assertEqual(result['missing_skills'], ['javascript'])
+        self.assertEqual(result['overall_fit'], 'poor')
+
+    def test_r_and_go_do_not_satisfy_react_and_django(self):
+        result = SkillMatcher.evaluate('Docker, Django, React', 'Skills: R, Go')
+        self.assertEqual(result['relevant_skills'], [])
+        self.assertEqual(result['missing_skills'], ['docker', 'django', 'react'])
+
+    def test_rest_api_not_matched_by_r(self):
+        result = SkillMatcher.evaluate('REST API', 'Statistics in R')
+        self.assertEqual(result['missing_skills'], ['rest api'])
+        self.assertEqual(result['overall_fit'], 'poor')
+
+    def test_free_form_skill_matches_partially(self):
+        result = SkillMatcher.evaluate('Python3, Django', 'Python and Django developer')
+        self.assertEqual(result['relevant_skills'], ['django', 'python'])
+        self.assertEqual(result['missing_skills'], [])
+
+
+class FindYearsTests(SimpleTestCase):
+    """_find_years must agree with the regex it replaces."""
+
+    YEARS_RE = re.compile(r"(\d+)\+?\s+years")
+
+    def _expected(self, s):
+        m = self.YEARS_RE.search(s)
+        return int(m.group(1)) if m else 0
+
+    def test_edge_cases_match_regex(self):
+        cases = [
+            '5+ years', '5 years', '5\n years', '5\t\n years', 'years', ' years',
+            '5years', '5+years', '+ years', '5++ years', 'x+ 5 years',
+            '3 years at A, 10 years at B', 'years then 7 years', '12+  years',
+            'over 20\u00a0years', '\u0665 years', 'years5 years', '',
+        ]
+        for s in cases:
+            with self.subTest(s=s):
+                self.assertEqual(_find_years(s), self._expected(s))
+
+    def test_random_inputs_match_regex(self):
+        rng = random.Random(0)
+        alphabet = ['1', '2', '0', '+', ' ', '\n', 'a', 'years', 'year', 's']
+        for _ in range(2000):
+            s = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            with self.subTest(s=s):
+                self.assertEqual(_find_years(s), self._expected(s))
+
+
+class SubmissionProcessingTests(TestCase):
+    """Inline and background (async=1) evaluation, and status polling."""
+
+    RESUME = b'Python and Django developer with 5 years of experience. Bachelor degree.'
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_override = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.media_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.job = JobPosting.objects.create(
+            title='Backend Developer',
+            description='Python Django developer with REST API experience',
+            required_skills='Python, Django'
+        )
+
+    def _apply(self, **extra):
+        resume = SimpleUploadedFile('resume.txt', self.RESUME, content_type='text/plain')
+        return self.client.post(
+            reverse('apply_job', args=[self.job.pk]),
+            {'resume': resume, 'candidate_name': 'Sam', **extra}
+        )
+
+    def test_inline_returns_full_payload(self):
+        response = self._apply()
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['status'], ResumeSubmission.STATUS_COMPLETED)
+        self.assertIsNotNone(data['score'])
+        self.assertEqual(data['relevant_skills'], ['django', 'python'])
+        self.assertEqual(data['missing_skills'], [])
+        submission = ResumeSubmission.objects.get(pk=data['id'])
+        self.assertEqual(submission.status, ResumeSubmission.STATUS_COMPLETED)
+        self.assertIn('Django developer', submission.extracted_text)
+
+    def test_async_returns_202_then_completes(self):
+        with mock.patch.object(tasks, '_EXECUTOR') as executor, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self._apply(**{'async': '1'})
+        self.assertEqual(response.status_code, 202)
+        data = response.json()
+        self.assertEqual(set(data), {'id', 'status'})
+        self.assertEqual(data['status'], ResumeSubmission.STATUS_PROCESSING)
+        executor.submit.assert_called_once()
+
+        status_url = reverse('submission_status', args=[data['id']])
+        self.assertEqual(self.client.get(status_url).json(),
+                         {'id': data['id'], 'status': ResumeSubmission.STATUS_PROCESSING})
+
+        # Run the queued job in this thread
+        submission = ResumeSubmission.objects.get(pk=data['id'])
+        self.assertTrue(tasks.process_submission(
+            submission, self.job.description, self.job.required_skills
+        ))
+
+        result = self.client.get(status_url).json()
+        self.assertEqual(result['status'], ResumeSubmission.STATUS_COMPLETED)
+        self.assertIsNotNone(result['score'])
+        self.assertEqual(result['relevant_skills'], ['django', 'python'])
+
+    def test_stale_processing_reported_failed(self):
+        submission = ResumeSubmission.objects.create(
+            job=self.job,
+            file=SimpleUploadedFile('resume.txt', self.RESUME),
+            status=ResumeSubmission.STATUS_PROCESSING
+        )
+        ResumeSubmission.objects.filter(pk=submission.pk).update(
+            created_at=timezone.now() - timedelta(seconds=ResumeSubmission.PROCESSING_TIMEOUT + 1)
+        )
+
+        response = self.client.get(reverse('submission_status', args=[submission.pk]))
+        self.assertEqual(response.json(),
+                         {'id': submission.pk, 'status': ResumeSubmission.STATUS_FAILED})
+
+        # A late worker must not flip the failed submission back to completed
+        submission.refresh_from_db()
+        self.assertFalse(tasks.process_submission(
+            submission, self.job.description, self.job.required_skills
+        ))
+        submission.refresh_from_db()
+        self.assertEqual(submission.status, ResumeSubmission.STATUS_FAILED)
+
+    def test_recent_processing_not_failed(self):
+        submission = ResumeSubmission.objects.create(
+            job=self.job,
+            file=SimpleUploadedFile('resume.txt', self.RESUME),
+            status=ResumeSubmission.STATUS_PROCESSING
+        )
+        response = self.client.get(reverse('submission_status', args=[submission.pk]))
+        self.assertEqual(response.json()['status'], ResumeSubmission.STATUS_PROCESSING)
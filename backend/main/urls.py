@@ -8,4 +8,5 @@ urlpatterns = [
     path('api/evaluate_resume/', views.evaluate_resume, name='evaluate_resume'),
     path('api/jobs/', views.list_jobs, name='list_jobs'),
     path('api/jobs/<int:pk>/apply/', views.apply_job, name='apply_job'),
+    path('api/submissions/<int:pk>/', views.submission_status, name='submission_status'),
 ]
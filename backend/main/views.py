@@ -4,26 +4,28 @@ This module provides REST API endpoints for:
 - Listing job postings  
 - Applying for jobs
 - Evaluating resumes
+- Polling the status/results of a submission
 
 All heavy lifting is delegated to specialized modules for clean separation of concerns:
 - extractors.py: TextExtractor class for text extraction from various formats
 - skills.py: SkillMatcher class for skill detection and matching
 - evaluators.py: HeuristicEvaluator, SemanticEvaluator, AIEvaluator, HybridEvaluator classes
 - config.py: Config class for API keys and sensitive configuration
+- tasks.py: Submission processing, run inline or on a background worker pool
+- responses.py: OrjsonResponse for fast JSON encoding of large payloads
 
 This keeps views.py clean and focused on just HTTP request/response handling.
 """
 
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
+from django.http import JsonResponse, Http404
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
 from .models import TestItem, ResumeSubmission, JobPosting
 from .forms import TestItemForm, ResumeUploadForm, JobPostingForm
-from .extractors import TextExtractor
-from .skills import SkillMatcher
-from .evaluators import HybridEvaluator
+from .tasks import create_submission, enqueue_submission, submission_payload
+from .responses import OrjsonResponse
 
 
 # ============================================================================
@@ -45,6 +47,38 @@ def index(request):
 # API ENDPOINTS - RESUME EVALUATION
 # ============================================================================
 
+def _wants_async(request):
+    """Whether the client asked for background processing (async=1/true)."""
+    return request.POST.get('async', '').lower() in ('1', 'true', 'yes')
+
+
+def _process_or_enqueue(request, resume_file, job_desc, required_skills, **fields):
+    """Evaluate an uploaded resume inline, or in the background if requested.
+
+    Inline, text is extracted from the upload itself and the submission is
+    inserted once with its results. In the background, a 'processing'
+    submission is inserted first and updated by the worker.
+
+    Args:
+        **fields: Other ResumeSubmission fields (job_id, candidate_name, ...)
+
+    Returns:
+        JsonResponse: Full results (200), or {"id", "status"} (202) when
+                      processing was deferred to a background worker
+    """
+    if _wants_async(request):
+        submission = ResumeSubmission.objects.create(
+            file=resume_file,
+            status=ResumeSubmission.STATUS_PROCESSING,
+            **fields
+        )
+        enqueue_submission(submission, job_desc, required_skills)
+        return JsonResponse({'id': submission.pk, 'status': submission.status}, status=202)
+
+    submission = create_submission(resume_file, job_desc, required_skills, **fields)
+    return JsonResponse(submission_payload(submission))
+
+
 @csrf_exempt
 def evaluate_resume(request):
     """API endpoint to evaluate a resume against a job description.
@@ -60,13 +94,17 @@ def evaluate_resume(request):
         - job_id or job (int, optional): JobPosting ID
         - candidate_name (str, optional): Candidate name
         - candidate_email (str, optional): Candidate email
+        - async (bool, optional): If "1"/"true", process in the background
+          and return HTTP 202 with {"id", "status": "processing"}; poll
+          /api/submissions/<id>/ for the results
         
     Response (JSON):
         {
             "id": 123,                              # Submission ID
+            "status": "completed",                  # processing/completed/failed
             "score": 75.5,                          # 0-100 score
             "feedback": "Keyword match: 80%...",    # Human-readable feedback
-            "evaluation_method": "hybrid",          # Method: grok, hybrid, or heuristic
+            "evaluation_method": "hybrid",          # Method: grok, semantic, hybrid, or heuristic
             "breakdown": {"heuristic": 70, ...},    # Score breakdown
             "relevant_skills": ["Python", "Django"],# Matching skills
             "missing_skills": ["AWS"],              # Missing skills
@@ -83,12 +121,14 @@ def evaluate_resume(request):
     # Resolve job from either direct description or job ID
     job_desc = request.POST.get('job_description', '')
     job_id = request.POST.get('job_id') or request.POST.get('job')
-    job_obj = None
+    job_pk = None
+    required_skills = ''
     
     if job_id:
         try:
-            job_obj = JobPosting.objects.get(pk=int(job_id))
-            job_desc = job_obj.description
+            # Cached (description, required_skills); no DB hit for popular jobs
+            job_desc, required_skills = JobPosting.get_evaluation_fields(int(job_id))
+            job_pk = int(job_id)
         except Exception:
             pass
     
@@ -97,54 +137,16 @@ def evaluate_resume(request):
     if not resume_file:
         return JsonResponse({'error': 'resume file not provided'}, status=400)
 
-    # Create submission and extract text
-    submission = ResumeSubmission.objects.create(file=resume_file, job=job_obj)
-    extracted_text = TextExtractor.extract_from_file(submission.file.path, submission.file.name)
-    submission.extracted_text = extracted_text
-    
-    # Store candidate info
+    # Extract text, evaluate skills (if job has requirements), score and
+    # save the submission with candidate info
     candidate_name = request.POST.get('candidate_name') or request.POST.get('name')
     candidate_email = request.POST.get('candidate_email') or request.POST.get('email')
-    if candidate_name:
-        submission.candidate_name = candidate_name
-    if candidate_email:
-        submission.candidate_email = candidate_email
-
-    # Evaluate skills if job has requirements
-    relevant_skills, missing_skills, overall_fit = [], [], 'poor'
-    if job_obj and job_obj.required_skills:
-        skill_result = SkillMatcher.evaluate(job_obj.required_skills, extracted_text)
-        relevant_skills = skill_result['relevant_skills']
-        missing_skills = skill_result['missing_skills']
-        overall_fit = skill_result['overall_fit']
-
-    # Perform hybrid evaluation (tries Grok, falls back to local)
-    eval_result = HybridEvaluator.evaluate(extracted_text, job_desc)
-
-    # Save results
-    submission.score = eval_result['score']
-    submission.feedback = eval_result['feedback']
-    submission.relevant_skills = relevant_skills if relevant_skills else None
-    submission.missing_skills = missing_skills if missing_skills else None
-    submission.overall_fit = overall_fit if job_obj and job_obj.required_skills else ''
-    submission.structured_assessment = {
-        'method': eval_result['method'],
-        'breakdown': eval_result.get('breakdown', {}),
-    }
-    submission.save()
-
-    # Return response
-    return JsonResponse({
-        'id': submission.pk,
-        'score': eval_result['score'],
-        'feedback': eval_result['feedback'],
-        'evaluation_method': eval_result['method'],
-        'breakdown': eval_result.get('breakdown', {}),
-        'relevant_skills': relevant_skills,
-        'missing_skills': missing_skills,
-        'overall_fit': overall_fit,
-        'structured_assessment': submission.structured_assessment
-    })
+    return _process_or_enqueue(
+        request, resume_file, job_desc, required_skills,
+        job_id=job_pk,
+        candidate_name=candidate_name or '',
+        candidate_email=candidate_email or ''
+    )
 
 
 def list_jobs(request):
@@ -170,20 +172,17 @@ def list_jobs(request):
             ]
         }
     """
-    jobs_data = []
-    for job in JobPosting.objects.order_by('-created_at'):
-        jobs_data.append({
-            'id': job.id,
-            'title': job.title,
-            'company': job.company,
-            'location': job.location,
-            'type': job.type,
-            'description': job.description,
-            'required_skills': job.required_skills,
-            'skills': job.get_skills_list(),  # Array format for frontend
-            'created_at': job.created_at.isoformat()
-        })
-    return JsonResponse({'jobs': jobs_data})
+    # Plain dicts straight from the cursor (no model instance per row);
+    # created_at stays a datetime, OrjsonResponse writes it as ISO 8601
+    jobs_data = list(JobPosting.objects.order_by('-created_at').values(
+        'id', 'title', 'company', 'location', 'type',
+        'description', 'required_skills', 'created_at'
+    ))
+    for job in jobs_data:
+        required_skills = job['required_skills']
+        # Array format for frontend
+        job['skills'] = [skill.strip() for skill in required_skills.split(',')] if required_skills else []
+    return OrjsonResponse({'jobs': jobs_data})
 
 
 @csrf_exempt
@@ -204,6 +203,7 @@ def apply_job(request, pk):
         - file or resume (file): Resume file
         - candidate_name (str): Candidate name
         - candidate_email (str): Candidate email
+        - async (bool, optional): Process in the background (see evaluate_resume)
         
     Response (JSON): Same as evaluate_resume endpoint
         
@@ -211,57 +211,50 @@ def apply_job(request, pk):
         - HTTP 400: resume file not provided
         - HTTP 404: Job posting not found
     """
-    job = get_object_or_404(JobPosting, pk=pk)
+    # Cached (description, required_skills); no DB hit for popular jobs
+    try:
+        job_desc, required_skills = JobPosting.get_evaluation_fields(pk)
+    except JobPosting.DoesNotExist:
+        raise Http404('No JobPosting matches the given query.')
 
     # Get and validate resume
     resume_file = request.FILES.get('file') or request.FILES.get('resume')
     if not resume_file:
         return JsonResponse({'error': 'resume file not provided'}, status=400)
 
-    # Create submission and extract text
-    submission = ResumeSubmission.objects.create(job=job, file=resume_file)
-    extracted_text = TextExtractor.extract_from_file(submission.file.path, submission.file.name)
-    submission.extracted_text = extracted_text
+    # Extract text, evaluate skills, score and save the submission
+    return _process_or_enqueue(
+        request, resume_file, job_desc, required_skills,
+        job_id=pk,
+        candidate_name=request.POST.get('candidate_name', ''),
+        candidate_email=request.POST.get('candidate_email', '')
+    )
+
+
+@require_http_methods(['GET'])
+def submission_status(request, pk):
+    """API endpoint to poll a submission's processing status and results.
     
-    # Store candidate info
-    submission.candidate_name = request.POST.get('candidate_name', '')
-    submission.candidate_email = request.POST.get('candidate_email', '')
-
-    # Evaluate skills
-    relevant_skills, missing_skills, overall_fit = [], [], 'poor'
-    if job.required_skills:
-        skill_result = SkillMatcher.evaluate(job.required_skills, extracted_text)
-        relevant_skills = skill_result['relevant_skills']
-        missing_skills = skill_result['missing_skills']
-        overall_fit = skill_result['overall_fit']
-
-    # Perform hybrid evaluation
-    eval_result = HybridEvaluator.evaluate(extracted_text, job.description)
-
-    # Save results
-    submission.score = eval_result['score']
-    submission.feedback = eval_result['feedback']
-    submission.relevant_skills = relevant_skills if relevant_skills else None
-    submission.missing_skills = missing_skills if missing_skills else None
-    submission.overall_fit = overall_fit if job.required_skills else ''
-    submission.structured_assessment = {
-        'method': eval_result['method'],
-        'breakdown': eval_result.get('breakdown', {}),
-    }
-    submission.save()
-
-    # Return response
-    return JsonResponse({
-        'id': submission.pk,
-        'score': eval_result['score'],
-        'feedback': eval_result['feedback'],
-        'evaluation_method': eval_result['method'],
-        'breakdown': eval_result.get('breakdown', {}),
-        'relevant_skills': relevant_skills,
-        'missing_skills': missing_skills,
-        'overall_fit': overall_fit,
-        'structured_assessment': submission.structured_assessment
-    })
+    HTTP Method: GET
+    URL: /main/api/submissions/<pk>/
+    
+    Response (JSON):
+        - While processing: {"id": 123, "status": "processing"}
+        - When failed: {"id": 123, "status": "failed"}
+        - When completed: same body as evaluate_resume
+        
+    Background jobs run in the web process and are lost if it restarts;
+    submissions still processing after ResumeSubmission.PROCESSING_TIMEOUT
+    are reported (and stored) as failed, so clients can resubmit.
+        
+    Error Responses:
+        - HTTP 404: Submission not found
+    """
+    submission = get_object_or_404(ResumeSubmission, pk=pk)
+    submission.fail_if_stale()
+    if submission.status != ResumeSubmission.STATUS_COMPLETED:
+        return JsonResponse({'id': submission.pk, 'status': submission.status})
+    return JsonResponse(submission_payload(submission))
 
 
 # ============================================================================